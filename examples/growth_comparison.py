@@ -9,7 +9,6 @@
 #
 
 import yahoo_finance_pynterface as yahoo
-import pandas                   as pd
 
 import matplotlib.pyplot        as plt
 import matplotlib.dates         as mdates
@@ -23,7 +22,7 @@ if __name__ == '__main__':
     
     data = yahoo.Get.Prices(tickers, interval="1mo", period=['2008-1-1','2018-08-31']);
 
-    assets = pd.DataFrame({ticker:(df['Adj Close'].pct_change()+1).cumprod() for ticker,df in data.items()});
+    assets = yahoo.analytics.Analytics(data, column='Adj Close').Growth();
     assets.index.name = "";
     assets.plot(ax=ax, title="A growth comparison since January, 2008");
 
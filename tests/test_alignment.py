@@ -0,0 +1,86 @@
+import unittest
+import numpy    as np
+import pandas   as pd
+
+from yahoo_finance_pynterface.alignment import Calendar, CalendarType, FillMethod
+
+
+class TestCalendar(unittest.TestCase):
+
+    def setUp(self):
+        Calendar.ClearCache();
+        # daily bars of two exchanges (naive UTC timestamps, as returned by 'Response').
+        self.a = pd.DataFrame({'Adj Close':[1.0, 2.0, 3.0, 4.0], 'Volume':[10, 20, 30, 40]},
+                              index=pd.to_datetime(['2020-01-02 14:30', '2020-01-03 14:30', '2020-01-06 14:30', '2020-01-07 14:30']));
+        self.b = pd.DataFrame({'Adj Close':[5.0, 6.0, 7.0], 'Volume':[1, 2, 3]},
+                              index=pd.to_datetime(['2020-01-03 08:00', '2020-01-06 08:00', '2020-01-08 08:00']));
+        self.data = {'A':self.a, 'B':self.b, 'C':None};
+
+    def assertFramesClose(self, x, y):
+        self.assertTrue((x.index==y.index).all());
+        self.assertTrue(np.allclose(x.to_numpy(dtype=float), y.to_numpy(dtype=float), equal_nan=True));
+
+    def test_union_and_intersection(self):
+        union = Calendar(self.data, how=CalendarType.UNION);
+        self.assertTrue(union.Index().equals(self.a.index.union(self.b.index)));
+        self.assertEqual(union.Tickers, ['A', 'B']);
+        intersection = Calendar(self.data, how=CalendarType.INTERSECTION);
+        self.assertEqual(len(intersection), 0);
+        intersection = Calendar({'A':self.a, 'B':self.a.iloc[1:]}, how=CalendarType.INTERSECTION);
+        self.assertTrue(intersection.Index().equals(self.a.index[1:]));
+
+    def test_align_matches_reindex(self):
+        calendar = Calendar.For(self.data);
+        for method,fill in [(FillMethod.NONE, None), (FillMethod.FFILL, 'ffill'), (FillMethod.ASOF, 'ffill')]:
+            aligned = calendar.Align(self.data, method);
+            self.assertIsNone(aligned['C']);
+            for ticker in ['A', 'B']:
+                self.assertFramesClose(aligned[ticker], self.data[ticker].reindex(calendar.Index(), method=fill));
+            panel = calendar.Panel(self.data, column='Adj Close', method=method);
+            expected = pd.DataFrame({ticker:self.data[ticker]['Adj Close'].reindex(calendar.Index(), method=fill) for ticker in ['A', 'B']});
+            self.assertFramesClose(panel, expected);
+
+    def test_asof_tolerance(self):
+        grid = pd.DataFrame({'Adj Close':np.zeros(6)}, index=pd.date_range('2020-01-02 14:30', periods=6, freq='min'));
+        sparse = pd.DataFrame({'Adj Close':[1.0, 2.0]}, index=pd.to_datetime(['2020-01-02 14:30', '2020-01-02 14:33']));
+        calendar = Calendar({'G':grid, 'S':sparse});
+        for tolerance in [None, pd.Timedelta('1min')]:
+            panel = calendar.Panel({'G':grid, 'S':sparse}, method=FillMethod.ASOF, tolerance=tolerance);
+            expected = sparse['Adj Close'].reindex(calendar.Index(), method='ffill', tolerance=tolerance);
+            self.assertTrue(np.allclose(panel['S'], expected, equal_nan=True));
+
+    def test_normalize_with_timezones(self):
+        calendar = Calendar(self.data, how=CalendarType.INTERSECTION, normalize=True,
+                            timezones={'A':'America/New_York', 'B':'Europe/London'});
+        self.assertTrue(calendar.Index().equals(pd.DatetimeIndex(['2020-01-03', '2020-01-06'], name="Date")));
+        panel = calendar.Panel(self.data);
+        self.assertEqual(panel['A'].tolist(), [2.0, 3.0]);
+        self.assertEqual(panel['B'].tolist(), [5.0, 6.0]);
+
+    def test_cache(self):
+        calendar = Calendar.For(self.data);
+        self.assertIs(Calendar.For(dict(self.data)), calendar);
+        self.assertIsNot(Calendar.For(self.data, how=CalendarType.INTERSECTION), calendar);
+        # same length and endpoints, different timestamps in between.
+        a = pd.DataFrame({'Adj Close':np.arange(4.0)}, index=pd.to_datetime(['2020-01-02 14:30', '2020-01-02 14:31', '2020-01-02 14:33', '2020-01-02 14:35']));
+        b = pd.DataFrame({'Adj Close':np.arange(4.0)}, index=pd.to_datetime(['2020-01-02 14:30', '2020-01-02 14:32', '2020-01-02 14:34', '2020-01-02 14:35']));
+        self.assertIsNot(Calendar.For({'A':a, 'B':a}), Calendar.For({'A':a, 'B':b}));
+        with self.assertRaises(ValueError):
+            Calendar.For({'A':a, 'B':a}).Panel({'A':a, 'B':b});
+        # same timestamps, in a different order.
+        shuffled = a.iloc[[1,0,2,3]];
+        self.assertIsNot(Calendar.For({'A':a}), Calendar.For({'A':shuffled}));
+        self.assertEqual(Calendar.For({'A':shuffled}).Panel({'A':shuffled})['A'].tolist(), [0.0, 1.0, 2.0, 3.0]);
+
+    def test_empty_frames(self):
+        calendar = Calendar({'A':self.a.iloc[:0], 'B':self.b});
+        self.assertTrue(calendar.Index().equals(self.b.index));
+        for method in FillMethod:
+            panel = calendar.Panel({'A':self.a.iloc[:0], 'B':self.b}, method=method);
+            self.assertTrue(panel['A'].isna().all());
+            self.assertEqual(panel['B'].tolist(), [5.0, 6.0, 7.0]);
+        self.assertEqual(len(Calendar({})), 0);
+
+
+if __name__ == '__main__':
+    unittest.main();
@@ -0,0 +1,88 @@
+import unittest
+import numpy    as np
+import pandas   as pd
+
+from yahoo_finance_pynterface.analytics import Analytics, ReturnsType
+
+
+def quotes(prices):
+    # One 'Get.Prices'-like frame per column, without the missing rows.
+    return {ticker:pd.DataFrame({'Adj Close':prices[ticker].dropna()}) for ticker in prices.columns};
+
+
+class TestAnalytics(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0);
+        index = pd.date_range('2020-01-01', periods=300, freq='D');
+        self.prices = pd.DataFrame(100*np.exp(np.cumsum(rng.normal(0, 0.01, (300,2)), axis=0)), index=index, columns=['A', 'B']);
+        self.prices.iloc[[3,50], 0] = np.nan;
+        self.prices.iloc[[0,1,120], 1] = np.nan;
+
+    def reference(self, prices, window):
+        previous = prices.ffill().shift();
+        log = np.log(prices/previous);
+        return {
+            'Prices'  : prices,
+            'Returns' : log,
+            'Mean'    : log.rolling(window).mean(),
+            'Std'     : log.rolling(window).std(),
+            'Drawdown': prices/prices.cummax()-1,
+            'Growth'  : prices/prices.apply(lambda s: s.dropna().iloc[0])};
+
+    def assertFramesClose(self, x, y):
+        self.assertTrue((x.index==y.index).all());
+        self.assertTrue(np.allclose(x.to_numpy(dtype=float), y.to_numpy(dtype=float), equal_nan=True));
+
+    def test_full_history_matches_pandas(self):
+        analytics = Analytics(quotes(self.prices), window=10);
+        for name,expected in self.reference(self.prices, 10).items():
+            self.assertFramesClose(getattr(analytics, name)(), expected);
+        simple = self.prices/self.prices.ffill().shift()-1;
+        self.assertFramesClose(analytics.Returns(ReturnsType.SIMPLE), simple);
+
+    def test_append_matches_full_history(self):
+        full = Analytics(quotes(self.prices), window=10);
+        partial = Analytics(quotes(self.prices.iloc[:100]), window=10);
+        # overlapping refreshes, growing past the initial capacity.
+        for start,stop in [(90,180), (170,260), (250,300)]:
+            partial.Append(quotes(self.prices.iloc[start:stop]));
+        self.assertEqual(len(partial), len(full));
+        for name in ['Prices', 'Returns', 'Mean', 'Std', 'Drawdown', 'Growth']:
+            self.assertFramesClose(getattr(partial, name)(), getattr(full, name)());
+
+    def test_append_replaces_the_last_bar(self):
+        full = Analytics(quotes(self.prices), window=10);
+        partial = Analytics(quotes(self.prices.iloc[:150]), window=10);
+        # a partial bar, fetched before the close...
+        provisional = self.prices.iloc[150:151]*1.5;
+        self.assertEqual(partial.Append(quotes(provisional)), 1);
+        # ...then the final one, and a bar of 'B' arriving after the one of 'A'.
+        partial.Append(quotes(self.prices.iloc[150:200]));
+        partial.Append({'A':pd.DataFrame({'Adj Close':self.prices['A'].iloc[199:201]})});
+        partial.Append({'B':pd.DataFrame({'Adj Close':self.prices['B'].iloc[200:201]})});
+        partial.Append(quotes(self.prices.iloc[200:]));
+        for name in ['Prices', 'Returns', 'Mean', 'Std', 'Drawdown', 'Growth']:
+            self.assertFramesClose(getattr(partial, name)(), getattr(full, name)());
+
+    def test_zero_price_only_affects_its_window(self):
+        prices = self.prices.iloc[:60].copy();
+        prices.iloc[10, 0] = 0.0;
+        expected = self.reference(prices, 5);
+        with np.errstate(divide='ignore', invalid='ignore'):
+            full = Analytics(quotes(prices), window=5);
+            partial = Analytics(quotes(prices.iloc[:12]), window=5);
+            partial.Append(quotes(prices.iloc[12:]));
+        for analytics in [full, partial]:
+            self.assertFramesClose(analytics.Mean(), expected['Mean']);
+            self.assertFramesClose(analytics.Std(), expected['Std']);
+        self.assertFalse(np.isnan(full.Std()['A'].iloc[16:50]).any());
+
+    def test_empty_frames(self):
+        analytics = Analytics(quotes(self.prices.iloc[:20]), window=5);
+        self.assertEqual(analytics.Append({'A':self.prices[['A']].iloc[:0].rename(columns={'A':'Adj Close'}), 'B':None}), 0);
+        self.assertEqual(len(analytics), 20);
+
+
+if __name__ == '__main__':
+    unittest.main();
@@ -0,0 +1,113 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import requests
+
+import yahoo_finance_pynterface as yahoo
+
+from yahoo_finance_pynterface import api, core, transport
+
+
+class Stub(transport.Transport):
+    # Offline stand-in for Yahoo: a quote page carrying the crumb, and a two-bar chart for any ticker,
+    # whose close prices tell how many times the same url has been requested.
+    def __init__(self):
+        self.calls = dict();
+
+    def Get(self, url, cookies=None):
+        key = self.Key(url);
+        self.calls[key] = self.calls.get(key, 0)+1;
+        close = float(self.calls[key]);
+        response = requests.models.Response();
+        response.url = url;
+        response.status_code = 200;
+        response.reason = "OK";
+        response.encoding = "utf-8";
+        if "/quote/" in url:
+            response.cookies = requests.cookies.cookiejar_from_dict({'B': "cookie"});
+            response._content = b'<html>\n"CrumbStore":{"crumb":"crumb"}\n</html>';
+        else:
+            response._content = json.dumps({'chart': {'error': None, 'result': [{
+                'meta': {'currency': "USD"},
+                'timestamp': [1577955600, 1578042000],
+                'indicators': {'quote': [{'open': [1.0, 2.0], 'high': [1.5, 2.5], 'low': [0.5, 1.5], 'close': [close, close], 'volume': [10, 20]}],
+                               'adjclose': [{'adjclose': [close, close]}]}}]}}).encode();
+        return response;
+
+
+class TestRecordReplay(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp();
+        self.fixture = os.path.join(self.folder, "fixture.json.gz");
+
+    def tearDown(self):
+        api.Session.Using();
+        yahoo.Get.With(core.ProcessingMode.AUTO);
+        shutil.rmtree(self.folder);
+
+    def record(self, tickers, mode, recorder=None):
+        yahoo.Get.With(mode);
+        recorder = recorder if recorder is not None else transport.Recorder(self.fixture, Stub());
+        api.Session.Using(recorder);
+        recorded = yahoo.Get.Prices(tickers, period="5d");
+        recorder.Save();
+        return recorder, recorded;
+
+    def closes(self, tickers, mode):
+        yahoo.Get.With(mode);
+        return {ticker:quotes['Close'].iloc[0] for ticker,quotes in yahoo.Get.Prices(tickers, period="5d").items()};
+
+    def test_serial_round_trip(self):
+        recorder, recorded = self.record(["AAPL"], core.ProcessingMode.SERIAL);
+        self.assertEqual(len(recorder), 2);
+
+        api.Session.Using(transport.Replayer(self.fixture));
+        replayed = yahoo.Get.Prices(["AAPL"], period="5d");
+        self.assertTrue(recorded['AAPL'].equals(replayed['AAPL']));
+
+    def test_parallel_round_trip(self):
+        recorder, recorded = self.record(["AAPL", "MSFT"], core.ProcessingMode.PARALLEL);
+        self.assertEqual(len(recorder), 4);
+
+        api.Session.Using(transport.Replayer(self.fixture));
+        replayed = yahoo.Get.Prices(["AAPL", "MSFT"], period="5d");
+        for ticker in ["AAPL", "MSFT"]:
+            self.assertTrue(recorded[ticker].equals(replayed[ticker]));
+
+    def test_serial_then_parallel_recording(self):
+        recorder, _ = self.record(["AAPL"], core.ProcessingMode.SERIAL);
+        self.record(["MSFT", "IBM", "GE"], core.ProcessingMode.PARALLEL, recorder);
+        self.assertEqual(len(recorder), 8);
+
+        entries = recorder.Collect();
+        self.assertEqual(len(entries[transport.Transport.Key("https://finance.yahoo.com/quote/SPY/history")]), 4);
+        for ticker in ["AAPL", "MSFT", "IBM", "GE"]:
+            self.assertEqual(len(entries[transport.Transport.Key(f"https://query1.finance.yahoo.com/v7/finance/chart/{ticker}?range=5d&interval=1d")]), 1);
+        self.assertEqual(len(transport.Replayer(self.fixture)), 8);
+
+    def test_parallel_replay_follows_recorded_order(self):
+        recorder, _ = self.record(["AAPL", "MSFT"], core.ProcessingMode.SERIAL);
+        self.record(["AAPL", "MSFT"], core.ProcessingMode.SERIAL, recorder);
+
+        for mode in [core.ProcessingMode.SERIAL, core.ProcessingMode.PARALLEL]:
+            api.Session.Using(transport.Replayer(self.fixture));
+            self.assertEqual(self.closes(["AAPL", "MSFT"], mode), {'AAPL':1.0, 'MSFT':1.0});
+            self.assertEqual(self.closes(["AAPL", "MSFT"], mode), {'AAPL':2.0, 'MSFT':2.0});
+            # the last response is repeated afterwards.
+            self.assertEqual(self.closes(["AAPL", "MSFT"], mode), {'AAPL':2.0, 'MSFT':2.0});
+
+    def test_replay_ignores_crumb_and_unambiguous_periods(self):
+        url = "https://query1.finance.yahoo.com/v7/finance/download/AAPL?period1=100&period2=200&interval=1d&crumb=";
+        with transport.Recorder(self.fixture, Stub()) as recorder:
+            recorder.Get(url+"a");
+        replayer = transport.Replayer(self.fixture);
+        self.assertEqual(replayer.Get(url.replace("period2=200", "period2=300")+"b").status_code, 200);
+        with self.assertRaises(requests.ConnectionError):
+            replayer.Get(url.replace("AAPL", "MSFT"));
+
+
+if __name__ == '__main__':
+    unittest.main();
@@ -32,6 +32,9 @@ __all__     = ['Get'];
 
 from . import api
 from . import core
+from . import transport
+from . import alignment
+from . import analytics
 
 import requests
 import datetime             as dt
@@ -44,6 +47,7 @@ TickerType = Union[str, List[str]];
 PeriodType = Optional[Union[str,List[Union[str,dt.datetime]]]];
 AccessModeType = Type[api.AccessModeInQuery];
 QueryType = Type[api.Query];
+TransportType = Type[transport.Transport];
 
 class Get():
     """
@@ -147,23 +151,33 @@ class Get():
     @classmethod
     def __serial__(cls, tickers:list, params:QueryType, using_api:AccessModeType) -> Dict[str,Any]:
         data = dict();
+        this_transport = api.Session.__transport__;
         for ticker in tickers:
-            response = cls.__get__(ticker, params, using_api, timeout=2);
+            response = cls.__get__(ticker, params, using_api, this_transport, timeout=2);
             data[ticker] = response if response else None;
         return data;
 
     @classmethod
     def __parallel__(cls, tickers:list, params:QueryType, using_api:AccessModeType) -> Dict[str,Any]:
         data = dict();
+        # the transport is handed over to the workers explicitly, and whatever it has collected there is merged back.
+        this_transport = api.Session.__transport__;
         with cf.ProcessPoolExecutor(max_workers=len(tickers)) as executor:
-            results = { executor.submit(cls.__get__, ticker, params, using_api, timeout=2) : ticker for ticker in tickers};
+            results = { executor.submit(cls.__remote__, ticker, params, using_api, this_transport, timeout=2) : ticker for ticker in tickers};
             for result in cf.as_completed(results):
-                data[results[result]] = result.result() if result.result() else None;
+                response, state = result.result();
+                this_transport.Merge(state);
+                data[results[result]] = response if response else None;
         return data;
+
+    @classmethod
+    def __remote__(cls, ticker:str, params:QueryType, this_api:AccessModeType, this_transport:TransportType, timeout:int=5) -> Tuple[Optional[dict],Any]:
+        response = cls.__get__(ticker, params, this_api, this_transport, timeout=timeout);
+        return response, this_transport.Collect();
     
     @staticmethod
-    def __get__(ticker:str, params:QueryType, this_api:AccessModeType, timeout:int=5) -> Optional[dict]:
-        err, res = api.Session.With(this_api).Get(ticker, params, timeout=timeout);
+    def __get__(ticker:str, params:QueryType, this_api:AccessModeType, this_transport:Optional[TransportType]=None, timeout:int=5) -> Optional[dict]:
+        err, res = api.Session.With(this_api, this_transport).Get(ticker, params, timeout=timeout);
         if err:
             err_msg = "*ERROR: {0:s}.\n{1:s}";
             if res['code']=='Unprocessable Entity':
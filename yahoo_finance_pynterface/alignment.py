@@ -0,0 +1,223 @@
+from . import core
+
+import pytz
+import collections
+import numpy            as np
+import pandas           as pd
+
+from typing             import Tuple, Dict, List, Union, ClassVar, Any, Optional, Type
+
+
+class CalendarType(core.API):
+    """
+    Enumeration class to list the ways the timestamps of several tickers can be combined into a calendar.
+    """
+    UNION = 'union';
+    INTERSECTION = 'intersection';
+
+
+class FillMethod(core.API):
+    """
+    Enumeration class to list the methods available to align a series to a calendar.
+    """
+    NONE = 'none';
+    FFILL = 'ffill';
+    ASOF = 'asof';
+
+
+class Calendar():
+    """
+    Class that builds a common trading calendar out of the timestamps of several tickers,
+    e.g. the quotes returned by 'Get.Prices(...)' for a list of tickers.
+
+    For each ticker, the integer position of its rows on the calendar is computed once;
+    aligning the series is then a plain numpy gather instead of a pandas 'reindex' or 'join'.
+    The available methods are:
+
+    - For(...) :      to get a (cached) calendar for a set of tickers;
+    - Index() :       to get the calendar itself;
+    - Positions(...): to get the position maps of each ticker;
+    - Align(...) :    to align whole frames to the calendar;
+    - Panel(...) :    to align a single column of each frame into a table indexed by ticker.
+
+    Missing rows are filled according to 'FillMethod':
+
+    - NONE :  only the timestamps matching exactly are taken, the others are left as NaN;
+    - FFILL : the last matching row on the calendar is carried forward;
+    - ASOF :  the last row at or before each timestamp of the calendar is taken, within an optional 'tolerance'.
+
+    Naive timestamps are treated as UTC, as returned by 'Response'.
+    When 'normalize' is set, each ticker is converted to its own timezone (see 'timezones')
+    and reduced to its local date, so that daily bars of different exchanges fall on the same day.
+    """
+
+    __cache__:ClassVar[Dict[tuple,'Calendar']] = collections.OrderedDict();
+    __cache_size__:ClassVar[int] = 32;
+
+    def __init__(self, data:Dict[str,Optional[Union[pd.DataFrame,pd.Series]]],
+                 how:Type[CalendarType]=CalendarType.UNION,
+                 timezones:Optional[Dict[str,str]]=None,
+                 normalize:bool=False):
+        if not isinstance(data,dict):
+            raise TypeError(f"invalid type for the argument 'data'! {type(dict())} expected; got {type(data)}");
+        if not isinstance(how,CalendarType):
+            raise TypeError(f"invalid type for the argument 'how'! <class 'CalendarType'> expected; got {type(how)}");
+        timezones = dict() if timezones is None else timezones;
+
+        # tickers whose request has failed come back as 'None' from 'Get': they are simply left out.
+        self.__tickers__:List[str] = [ticker for ticker,df in data.items() if df is not None];
+        self.__how__:CalendarType = how;
+        self.__timezones__:Dict[str,Optional[str]] = {ticker:timezones.get(ticker) for ticker in self.__tickers__};
+        self.__normalize__:bool = normalize;
+        self.__fingerprints__:Dict[str,tuple] = {ticker:self.__fingerprint__(data[ticker].index) for ticker in self.__tickers__};
+        self.__raw__:Dict[str,np.ndarray] = {ticker:self.__values__(data[ticker].index) for ticker in self.__tickers__};
+
+        # sorted timestamps (as int64) of each ticker, together with the permutation that sorts its rows.
+        self.__stamps__:Dict[str,np.ndarray] = dict();
+        self.__order__:Dict[str,np.ndarray] = dict();
+        for ticker in self.__tickers__:
+            stamps = self.__int64__(data[ticker].index, self.__timezones__[ticker], normalize);
+            order = np.argsort(stamps, kind='stable');
+            self.__stamps__[ticker] = stamps[order];
+            self.__order__[ticker] = order;
+
+        if len(self.__tickers__)==0:
+            calendar = np.empty(0, dtype=np.int64);
+        elif how is CalendarType.UNION:
+            calendar = np.unique(np.concatenate([self.__stamps__[ticker] for ticker in self.__tickers__]));
+        else:
+            calendar = np.unique(self.__stamps__[self.__tickers__[0]]);
+            for ticker in self.__tickers__[1:]:
+                calendar = np.intersect1d(calendar, self.__stamps__[ticker]);
+        self.__calendar__:np.ndarray = calendar;
+        self.__index__:pd.DatetimeIndex = pd.DatetimeIndex(calendar.view('datetime64[ns]'), name="Date" if normalize else f"Date ({pytz.utc})");
+
+        self.__positions__:Dict[tuple,Dict[str,np.ndarray]] = dict();
+        self.Positions(FillMethod.NONE);
+
+    def __len__(self):
+        return len(self.__calendar__);
+
+    @classmethod
+    def For(cls, data:Dict[str,Optional[Union[pd.DataFrame,pd.Series]]],
+            how:Type[CalendarType]=CalendarType.UNION,
+            timezones:Optional[Dict[str,str]]=None,
+            normalize:bool=False) -> 'Calendar':
+        # Calendars are cached on the tickers, on a hash of the timestamps of their indices and on the options;
+        # the most recently used ones are kept up to '__cache_size__'.
+        if not isinstance(data,dict):
+            raise TypeError(f"invalid type for the argument 'data'! {type(dict())} expected; got {type(data)}");
+        key = (tuple((ticker, cls.__fingerprint__(df.index)) for ticker,df in sorted(data.items(), key=lambda item: item[0]) if df is not None),
+               how, tuple(sorted((timezones or dict()).items())), normalize);
+        if key in cls.__cache__:
+            cls.__cache__.move_to_end(key);
+        else:
+            cls.__cache__[key] = cls(data, how=how, timezones=timezones, normalize=normalize);
+            while len(cls.__cache__)>cls.__cache_size__:
+                cls.__cache__.popitem(last=False);
+        return cls.__cache__[key];
+
+    @classmethod
+    def ClearCache(cls) -> None:
+        cls.__cache__.clear();
+
+    @property
+    def Tickers(self) -> List[str]:
+        return list(self.__tickers__);
+
+    def Index(self) -> pd.DatetimeIndex:
+        return self.__index__;
+
+    def Positions(self, method:Type[FillMethod]=FillMethod.NONE, tolerance:Optional[pd.Timedelta]=None) -> Dict[str,np.ndarray]:
+        # Position maps hold, for each timestamp of the calendar, the row of the ticker to be taken (-1 if none).
+        if not isinstance(method,FillMethod):
+            raise TypeError(f"invalid type for the argument 'method'! <class 'FillMethod'> expected; got {type(method)}");
+        tolerance = None if tolerance is None or method is not FillMethod.ASOF else pd.Timedelta(tolerance);
+        key = (method, tolerance);
+        if key not in self.__positions__:
+            self.__positions__[key] = {ticker:self.__map__(ticker, method, tolerance) for ticker in self.__tickers__};
+        return self.__positions__[key];
+
+    def Align(self, data:Dict[str,Optional[Union[pd.DataFrame,pd.Series]]],
+              method:Type[FillMethod]=FillMethod.NONE,
+              tolerance:Optional[pd.Timedelta]=None) -> Dict[str,Optional[Union[pd.DataFrame,pd.Series]]]:
+        positions = self.Positions(method, tolerance);
+        aligned = dict();
+        for ticker,df in data.items():
+            if df is None:
+                aligned[ticker] = None;
+                continue;
+            self.__check__(ticker, df);
+            values = self.__gather__(df.to_numpy(), positions[ticker]);
+            if isinstance(df,pd.Series):
+                aligned[ticker] = pd.Series(values, index=self.__index__, name=df.name);
+            else:
+                aligned[ticker] = pd.DataFrame(values, index=self.__index__, columns=df.columns);
+        return aligned;
+
+    def Panel(self, data:Dict[str,Optional[pd.DataFrame]],
+              column:str="Adj Close",
+              method:Type[FillMethod]=FillMethod.NONE,
+              tolerance:Optional[pd.Timedelta]=None) -> pd.DataFrame:
+        positions = self.Positions(method, tolerance);
+        tickers = [ticker for ticker in self.__tickers__ if data.get(ticker) is not None];
+        values = np.full((len(self.__calendar__), len(tickers)), np.nan);
+        for j,ticker in enumerate(tickers):
+            self.__check__(ticker, data[ticker]);
+            values[:,j] = self.__gather__(data[ticker][column].to_numpy(dtype=float), positions[ticker]);
+        return pd.DataFrame(values, index=self.__index__, columns=tickers);
+
+    def __map__(self, ticker:str, method:Type[FillMethod], tolerance:Optional[pd.Timedelta]) -> np.ndarray:
+        stamps = self.__stamps__[ticker];
+        if len(stamps)==0:
+            return np.full(len(self.__calendar__), -1);
+        # the last row at or before each timestamp of the calendar (the last one, in case of duplicates).
+        pos = np.searchsorted(stamps, self.__calendar__, side='right')-1;
+        found = pos>=0;
+        if method is FillMethod.ASOF:
+            if tolerance is not None:
+                found &= (self.__calendar__-stamps[np.maximum(pos,0)])<=tolerance.value;
+        else:
+            found &= stamps[np.maximum(pos,0)]==self.__calendar__;
+            if method is FillMethod.FFILL:
+                last = np.maximum.accumulate(np.where(found, np.arange(len(pos)), -1));
+                found = last>=0;
+                pos = pos[np.maximum(last,0)];
+        return np.where(found, self.__order__[ticker][np.maximum(pos,0)], -1);
+
+    def __check__(self, ticker:str, df:Union[pd.DataFrame,pd.Series]) -> None:
+        if ticker not in self.__fingerprints__:
+            raise KeyError(f"ticker '{ticker}' is not part of the calendar");
+        if not np.array_equal(self.__values__(df.index), self.__raw__[ticker]):
+            raise ValueError(f"the index of ticker '{ticker}' does not match the one the calendar has been built on");
+
+    @staticmethod
+    def __gather__(values:np.ndarray, positions:np.ndarray) -> np.ndarray:
+        if values.dtype.kind in 'iub':
+            values = values.astype(float);
+        elif values.dtype.kind!='f':
+            values = values.astype(object);
+        out = values[np.maximum(positions,0)] if len(values)>0 else np.empty((len(positions),)+values.shape[1:], dtype=values.dtype);
+        out[positions<0] = np.nan;
+        return out;
+
+    @classmethod
+    def __fingerprint__(cls, index:pd.Index) -> tuple:
+        # the hash depends on the order of the timestamps as well, as '__check__' does.
+        return (len(index), str(getattr(index, 'tz', None)), hash(cls.__values__(index).tobytes()));
+
+    @staticmethod
+    def __values__(index:pd.Index) -> np.ndarray:
+        # the timestamps of the index, as they are (i.e. neither sorted nor converted), as int64.
+        return pd.DatetimeIndex(index).values.astype('datetime64[ns]').view(np.int64);
+
+    @staticmethod
+    def __int64__(index:pd.Index, tz:Optional[str], normalize:bool) -> np.ndarray:
+        index = pd.DatetimeIndex(index);
+        if index.tz is None:
+            index = index.tz_localize(pytz.utc);
+        if normalize:
+            index = index.tz_convert(tz if tz is not None else index.tz).normalize();
+        else:
+            index = index.tz_convert(pytz.utc);
+        return index.tz_localize(None).values.astype('datetime64[ns]').view(np.int64);
@@ -0,0 +1,214 @@
+from . import core
+from . import alignment
+
+import numpy            as np
+import pandas           as pd
+
+from typing             import Tuple, Dict, List, Union, ClassVar, Any, Optional, Type
+
+
+class ReturnsType(core.API):
+    """
+    Enumeration class to list the kinds of returns that is possible to compute.
+    """
+    SIMPLE = 'simple';
+    LOG = 'log';
+
+
+class Analytics():
+    """
+    Class that keeps track of a panel of price series (one column per ticker)
+    and of the statistics derived from it:
+
+    - Returns(...) :   simple or log returns;
+    - Mean() :         rolling mean of the returns;
+    - Std() :          rolling (sample) standard deviation of the returns;
+    - Drawdown() :     the drawdown from the running maximum;
+    - Growth() :       the growth with respect to the first available price.
+
+    It is meant to be fed with the output of 'Get.Prices(...)', that is, a dictionary of quotes indexed by ticker.
+    The statistics are computed column-wise with numpy over all the tickers at once.
+    Use the 'Append(...)' method to push newer bars: only the new rows are processed,
+    so that refreshing the statistics costs O(new bars) rather than O(whole history).
+    The last bar already processed is processed again as well, so that a partial bar
+    (e.g. today's one, fetched during market hours) is replaced by its most recent values;
+    bars older than that are ignored.
+    """
+
+    __initial_capacity__:ClassVar[int] = 256;
+
+    def __init__(self, data:Dict[str,Optional[pd.DataFrame]],
+                 column:str="Adj Close",
+                 window:int=20,
+                 min_periods:Optional[int]=None,
+                 returns:Type[ReturnsType]=ReturnsType.LOG):
+        if not isinstance(data,dict):
+            raise TypeError(f"invalid type for the argument 'data'! {type(dict())} expected; got {type(data)}");
+        if not isinstance(window,int) or window<1:
+            raise ValueError(f"invalid value for the argument 'window'! a positive {type(int())} expected; got {window}");
+        if min_periods is None:
+            min_periods = window;
+        elif not isinstance(min_periods,int) or not 1<=min_periods<=window:
+            raise ValueError(f"invalid value for the argument 'min_periods'! an {type(int())} between 1 and 'window' expected; got {min_periods}");
+        if not isinstance(returns,ReturnsType):
+            raise TypeError(f"invalid type for the argument 'returns'! <class 'ReturnsType'> expected; got {type(returns)}");
+
+        # tickers whose request has failed come back as 'None' from 'Get': they are simply left out.
+        self.__tickers__:List[str] = [ticker for ticker,df in data.items() if df is not None];
+        self.__column__:str = column;
+        self.__window__:int = window;
+        self.__min_periods__:int = min_periods;
+        self.__returns__:ReturnsType = returns;
+
+        self.__length__:int = 0;
+        self.__index_name__:Optional[str] = None;
+        self.__stamps__:np.ndarray = np.empty(self.__initial_capacity__, dtype=np.int64);
+        self.__prices__:np.ndarray = np.empty((self.__initial_capacity__, len(self.__tickers__)));
+        self.__simple__:np.ndarray = np.empty_like(self.__prices__);
+        self.__log__:np.ndarray = np.empty_like(self.__prices__);
+        self.__mean__:np.ndarray = np.empty_like(self.__prices__);
+        self.__std__:np.ndarray = np.empty_like(self.__prices__);
+        self.__drawdown__:np.ndarray = np.empty_like(self.__prices__);
+        self.__growth__:np.ndarray = np.empty_like(self.__prices__);
+
+        # running state, one entry per ticker.
+        self.__last__:np.ndarray = np.full(len(self.__tickers__), np.nan);
+        self.__base__:np.ndarray = np.full(len(self.__tickers__), np.nan);
+        self.__peak__:np.ndarray = np.full(len(self.__tickers__), np.nan);
+        # the running state before the last row, to process it again when it gets updated.
+        self.__rollback__:Tuple[np.ndarray,np.ndarray,np.ndarray] = (self.__last__, self.__peak__, self.__base__);
+
+        self.__update__(*self.__panel__(data));
+
+    def __len__(self):
+        return self.__length__;
+
+    @property
+    def Tickers(self) -> List[str]:
+        return list(self.__tickers__);
+
+    def Append(self, data:Dict[str,Optional[pd.DataFrame]]) -> int:
+        # Only the bars at or after the last one already processed are taken into account,
+        # so that overlapping periods (e.g. a refresh over the last '5d') can be appended as they are.
+        # Returns the number of rows processed, the updated last one included.
+        if not isinstance(data,dict):
+            raise TypeError(f"invalid type for the argument 'data'! {type(dict())} expected; got {type(data)}");
+        stamps, prices = self.__panel__(data);
+        n = self.__length__;
+        if n>0:
+            newer = stamps>=self.__stamps__[n-1];
+            stamps, prices = stamps[newer], prices[newer];
+            if len(stamps)>0 and stamps[0]==self.__stamps__[n-1]:
+                # the last row is rolled back; tickers missing from the new data keep their previous price.
+                prices[0] = np.where(np.isnan(prices[0]), self.__prices__[n-1], prices[0]);
+                self.__last__, self.__peak__, self.__base__ = self.__rollback__;
+                self.__length__ = n-1;
+        self.__update__(stamps, prices);
+        return len(stamps);
+
+    def Prices(self) -> pd.DataFrame:
+        return self.__frame__(self.__prices__);
+
+    def Returns(self, kind:Optional[Type[ReturnsType]]=None) -> pd.DataFrame:
+        kind = self.__returns__ if kind is None else kind;
+        if not isinstance(kind,ReturnsType):
+            raise TypeError(f"invalid type for the argument 'kind'! <class 'ReturnsType'> expected; got {type(kind)}");
+        return self.__frame__(self.__log__ if kind is ReturnsType.LOG else self.__simple__);
+
+    def Mean(self) -> pd.DataFrame:
+        return self.__frame__(self.__mean__);
+
+    def Std(self) -> pd.DataFrame:
+        return self.__frame__(self.__std__);
+
+    def Drawdown(self) -> pd.DataFrame:
+        return self.__frame__(self.__drawdown__);
+
+    def Growth(self) -> pd.DataFrame:
+        return self.__frame__(self.__growth__);
+
+    def __frame__(self, values:np.ndarray) -> pd.DataFrame:
+        index = pd.DatetimeIndex(self.__stamps__[:self.__length__].view('datetime64[ns]'), name=self.__index_name__);
+        return pd.DataFrame(values[:self.__length__].copy(), index=index, columns=self.__tickers__);
+
+    def __panel__(self, data:Dict[str,Optional[pd.DataFrame]]) -> Tuple[np.ndarray,np.ndarray]:
+        # Align the requested column of each ticker on the union of their timestamps (as int64).
+        frames = {ticker:df for ticker,df in data.items() if ticker in self.__tickers__ and df is not None};
+        panel = alignment.Calendar(frames, how=alignment.CalendarType.UNION).Panel(frames, column=self.__column__);
+        self.__index_name__ = panel.index.name;
+        return panel.index.values.astype('datetime64[ns]').view(np.int64), panel.reindex(columns=self.__tickers__).to_numpy(dtype=float);
+
+    def __reserve__(self, size:int) -> None:
+        capacity = self.__prices__.shape[0];
+        if size<=capacity:
+            return;
+        while capacity<size:
+            capacity *= 2;
+        for name in ['__stamps__', '__prices__', '__simple__', '__log__', '__mean__', '__std__', '__drawdown__', '__growth__']:
+            old = getattr(self, name);
+            new = np.empty((capacity,)+old.shape[1:], dtype=old.dtype);
+            new[:self.__length__] = old[:self.__length__];
+            setattr(self, name, new);
+
+    def __update__(self, stamps:np.ndarray, prices:np.ndarray) -> None:
+        k = prices.shape[0];
+        if k==0:
+            return;
+        n, w = self.__length__, self.__window__;
+        self.__reserve__(n+k);
+        rows = slice(n, n+k);
+
+        # previous valid price of each bar: forward fill over the last known prices followed by the new block.
+        valid = ~np.isnan(prices);
+        filled = np.vstack([self.__last__, prices]);
+        position = np.where(np.vstack([np.ones(len(self.__tickers__), dtype=bool), valid]), np.arange(k+1)[:,None], 0);
+        position = np.maximum.accumulate(position, axis=0);
+        filled = np.take_along_axis(filled, position, axis=0);
+        previous = filled[:-1];
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = prices/previous;
+            self.__simple__[rows] = ratio-1.0;
+            self.__log__[rows] = np.log(ratio);
+
+        # rolling moments from cumulative sums over the tail of the previous returns plus the new ones.
+        t = min(n, w-1);
+        r = (self.__log__ if self.__returns__ is ReturnsType.LOG else self.__simple__)[n-t:n+k];
+        # non-finite returns (e.g. after a zero price) are left out, as missing ones.
+        observed = np.isfinite(r);
+        zeros = np.zeros((1, r.shape[1]));
+        s1 = np.vstack([zeros, np.cumsum(np.where(observed, r, 0.0), axis=0)]);
+        s2 = np.vstack([zeros, np.cumsum(np.where(observed, r*r, 0.0), axis=0)]);
+        c = np.vstack([zeros, np.cumsum(observed, axis=0)]);
+        hi = np.arange(t+1, t+k+1);
+        lo = np.maximum(hi-w, 0);
+        count = c[hi]-c[lo];
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = (s1[hi]-s1[lo])/count;
+            var = np.maximum((s2[hi]-s2[lo])-count*mean*mean, 0.0)/(count-1);
+        self.__mean__[rows] = np.where(count>=self.__min_periods__, mean, np.nan);
+        self.__std__[rows] = np.where((count>=self.__min_periods__) & (count>1), np.sqrt(var), np.nan);
+
+        # drawdown from the running maximum (NaNs are skipped by 'fmax').
+        peak = np.fmax.accumulate(np.vstack([self.__peak__, prices]), axis=0);
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.__drawdown__[rows] = prices/peak[1:]-1.0;
+
+        # growth with respect to the first valid price of each ticker.
+        base = np.where(np.isnan(self.__base__), self.__first__(prices), self.__base__);
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.__growth__[rows] = prices/base;
+
+        self.__rollback__ = (filled[-2], peak[-2], np.where(np.isnan(self.__base__), self.__first__(prices[:-1]), self.__base__));
+        self.__stamps__[rows] = stamps;
+        self.__prices__[rows] = prices;
+        self.__last__ = filled[-1];
+        self.__peak__ = peak[-1];
+        self.__base__ = base;
+        self.__length__ = n+k;
+
+    @staticmethod
+    def __first__(prices:np.ndarray) -> np.ndarray:
+        # the first valid price of each column (NaN if there is none).
+        valid = ~np.isnan(prices);
+        return np.where(valid.any(axis=0), prices[valid.argmax(axis=0), np.arange(prices.shape[1])], np.nan) if len(prices)>0 else np.full(prices.shape[1], np.nan);
@@ -1,4 +1,5 @@
 from . import core
+from . import transport
 
 import io
 import re  
@@ -230,9 +231,10 @@ class Response:
 class Session:
     """
     A lower level class that explicitly requests data to Yahoo Finance via HTTP.
-    I provides two 'public' methods:
+    I provides three 'public' methods:
     
-    - With(...):  to set the favorite access mode;
+    - With(...):  to set the favorite access mode (and, optionally, the transport of that session only);
+    - Using(...): to set the default transport the HTTP requests go through (see 'transport.Recorder' and 'transport.Replayer');
     - Get(...):   to explicitly push request to Yahoo.
     
     It implements a recursive call to the HTTP 'GET' method in case of failure.
@@ -241,6 +243,7 @@ class Session:
 
     __yahoo_finance_url__:str = "";
     __yahoo_finance_api__:Type[AccessModeInQuery] = AccessModeInQuery.NONE;
+    __transport__:transport.Transport = transport.Transport();
 
     def __init__(self):
         self.__last_time_checked__ : dt.datetime;
@@ -248,16 +251,29 @@ class Session:
         self.__crumb__ : str;
 
     @classmethod
-    def With(cls, this_api:Type[AccessModeInQuery]) -> 'Session':
+    def With(cls, this_api:Type[AccessModeInQuery], this_transport:Optional[transport.Transport]=None) -> 'Session':
         if not isinstance(this_api,AccessModeInQuery):
             raise TypeError(f"invalid type for the argument 'this_api'; <class 'AccessModeInQuery'> expected, got {type(this_api)}.");
+        elif this_transport is not None and not isinstance(this_transport,transport.Transport):
+            raise TypeError(f"invalid type for the argument 'this_transport'; <class 'transport.Transport'> expected, got {type(this_transport)}.");
         else:
             cls.__set_api__(this_api);
             cls.__set_url__();
             session = cls();
+            if this_transport is not None:
+                session.__transport__ = this_transport;
             session.__start__();
             return session;
 
+    @classmethod
+    def Using(cls, this_transport:Optional[transport.Transport]=None) -> None:
+        if this_transport is None:
+            cls.__transport__ = transport.Transport();
+        elif not isinstance(this_transport,transport.Transport):
+            raise TypeError(f"invalid type for the argument 'this_transport'; <class 'transport.Transport'> expected, got {type(this_transport)}.");
+        else:
+            cls.__transport__ = this_transport;
+
     @classmethod
     def __set_url__(cls) -> None:
         if cls.__yahoo_finance_api__ is not AccessModeInQuery.NONE:
@@ -273,8 +289,9 @@ class Session:
         #    print(f"*INFO: the session 'api' was already '{input_api}'.");
 
     def __start__(self) -> None:
-        r = requests.get('https://finance.yahoo.com/quote/SPY/history');
+        r = self.__transport__.Get('https://finance.yahoo.com/quote/SPY/history');
         self.__cookies__ = requests.cookies.cookiejar_from_dict({'B': r.cookies['B']});
+        self.__crumb__ = "";
         pattern = re.compile(r'.*"CrumbStore":\{"crumb":"(?P<crumb>[^"]+)"\}');
         for line in r.text.splitlines():
             crumb_match = pattern.match(line)
@@ -311,7 +328,7 @@ class Session:
             query = f"?{str(params)}&crumb={self.__crumb__}" if params else f"?crumb={self.__crumb__}";
             url = self.__yahoo_finance_url__ + ticker + query;
             try:
-                response = requests.get(url, cookies=self.__cookies__)
+                response = self.__transport__.Get(url, cookies=self.__cookies__)
                 response.raise_for_status();
             except requests.HTTPError as e:
                 if response.status_code in [408, 409, 429]:
@@ -0,0 +1,195 @@
+import gzip
+import json
+import time
+import base64
+import requests
+import urllib.parse
+
+from typing             import Tuple, Dict, List, Union, ClassVar, Any, Optional, Type
+
+
+class Transport():
+    """
+    Class that pushes the HTTP 'GET' requests on behalf of 'Session'.
+    The base class simply relies on 'requests'; see 'Recorder' and 'Replayer' for the alternatives.
+
+    Transports are handed over (i.e. pickled) to the worker processes when 'Get' runs in parallel:
+    whatever a copy returns from 'Collect()' in a worker is passed to 'Merge(...)' of the original one.
+    """
+
+    def Get(self, url:str, cookies:Optional[requests.cookies.RequestsCookieJar]=None) -> requests.models.Response:
+        return requests.get(url, cookies=cookies);
+
+    def Collect(self) -> Any:
+        return None;
+
+    def Merge(self, state:Any) -> None:
+        pass;
+
+    @staticmethod
+    def Key(url:str, periods:bool=True) -> str:
+        # The crumb changes from one session to another: it is not taken into account to identify a request.
+        # Neither are 'period1' and 'period2' when 'periods' is False.
+        ignored = ['crumb'] if periods else ['crumb', 'period1', 'period2'];
+        parts = urllib.parse.urlsplit(url);
+        query = urllib.parse.urlencode([(k,v) for k,v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True) if k not in ignored]);
+        return urllib.parse.urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""));
+
+
+class Recorder(Transport):
+    """
+    Transport that forwards the requests to another transport (by default, the live one)
+    and keeps track of the responses, so that they can be saved into a gzip-compressed fixture file
+    to be served later on by 'Replayer'.
+
+    Fixtures are written by 'Save()', or when leaving the 'with' block the recorder is used in.
+    The responses recorded by the worker processes are gathered back when 'Get' runs in parallel.
+    """
+
+    __version__:ClassVar[int] = 1;
+
+    def __init__(self, path:str, transport:Optional[Transport]=None):
+        if not isinstance(path,str):
+            raise TypeError(f"invalid type for the argument 'path'! {type(str())} expected; got {type(path)}");
+        self.__path__:str = path;
+        self.__transport__:Transport = transport if transport is not None else Transport();
+        self.__entries__:Dict[str,List[Dict[str,Any]]] = dict();
+
+    def __enter__(self) -> 'Recorder':
+        return self;
+
+    def __exit__(self, *args) -> None:
+        self.Save();
+
+    def __len__(self):
+        return sum(len(responses) for responses in self.__entries__.values());
+
+    def Get(self, url:str, cookies:Optional[requests.cookies.RequestsCookieJar]=None) -> requests.models.Response:
+        response = self.__transport__.Get(url, cookies=cookies);
+        self.__entries__.setdefault(self.Key(url), list()).append({
+            'status'   : response.status_code,
+            'reason'   : response.reason,
+            'encoding' : response.encoding,
+            'headers'  : dict(response.headers),
+            'cookies'  : requests.utils.dict_from_cookiejar(response.cookies),
+            'content'  : base64.b64encode(response.content).decode('ascii')});
+        return response;
+
+    def __getstate__(self) -> Dict[str,Any]:
+        # copies sent to the workers start with no entries: only the new ones are collected back.
+        return dict(self.__dict__, __entries__=dict());
+
+    def Collect(self) -> Any:
+        return self.__entries__;
+
+    def Merge(self, state:Any) -> None:
+        for key,responses in state.items():
+            self.__entries__.setdefault(key, list()).extend(responses);
+
+    def Save(self) -> None:
+        with gzip.open(self.__path__, 'wt', encoding='utf-8') as f:
+            json.dump({'version':self.__version__, 'entries':self.__entries__}, f);
+
+
+class Replayer(Transport):
+    """
+    Transport that serves the responses stored in a fixture file written by 'Recorder', without any network access.
+    Fixtures are decoded once and kept in memory.
+
+    Requests are matched on their url (crumb excluded); the responses recorded for the same url
+    are served in the same order, the last one being repeated afterwards.
+    When 'Get' runs in parallel, the workers carry on from the responses served so far
+    and report back what they have served; requests for the same url pushed concurrently
+    by different workers (e.g. the quote page of each session) are served in no particular order.
+    Note that 'period1' and 'period2' depend on the current time when no period is given to 'Get'
+    (the default for the 'download' API), and on the local timezone when dates are given.
+    Hence, when no url matches exactly, the url with 'period1' and 'period2' excluded is tried as well,
+    provided that it identifies a single recorded url.
+    A 'requests.ConnectionError' is raised for urls that have not been recorded.
+
+    Network conditions may be simulated by means of:
+
+    - latency :    seconds to wait before each response;
+    - bandwidth :  bytes per second at which the content is delivered (None for unlimited).
+    """
+
+    # decoded fixtures, by path: copies unpickled in the workers (or inherited by forking) do not decode them again.
+    __fixtures__:ClassVar[Dict[str,Tuple[Dict[str,List[Dict[str,Any]]],Dict[str,List[str]]]]] = dict();
+
+    def __init__(self, path:str, latency:float=0.0, bandwidth:Optional[float]=None):
+        if not isinstance(path,str):
+            raise TypeError(f"invalid type for the argument 'path'! {type(str())} expected; got {type(path)}");
+        if latency<0:
+            raise ValueError(f"invalid value for the argument 'latency'! a non-negative number expected; got {latency}");
+        if bandwidth is not None and bandwidth<=0:
+            raise ValueError(f"invalid value for the argument 'bandwidth'! a positive number expected; got {bandwidth}");
+        self.__latency__:float = latency;
+        self.__bandwidth__:Optional[float] = bandwidth;
+        self.__served__:Dict[str,int] = dict();
+        self.__forked__:Dict[str,int] = dict();
+        self.__path__:str = path;
+        self.__entries__:Dict[str,List[Dict[str,Any]]];
+        self.__loose__:Dict[str,List[str]];
+        self.__entries__, self.__loose__ = self.__load__(path);
+
+    @classmethod
+    def __load__(cls, path:str) -> Tuple[Dict[str,List[Dict[str,Any]]],Dict[str,List[str]]]:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            fixture = json.load(f);
+        if fixture.get('version')!=Recorder.__version__:
+            raise ValueError(f"unsupported fixture version '{fixture.get('version')}' in '{path}'");
+        entries = {key:[dict(entry, content=base64.b64decode(entry['content'])) for entry in responses]
+                   for key,responses in fixture['entries'].items()};
+        loose = dict();
+        for key in entries:
+            loose.setdefault(cls.Key(key, periods=False), list()).append(key);
+        cls.__fixtures__[path] = (entries, loose);
+        return entries, loose;
+
+    def __getstate__(self) -> Dict[str,Any]:
+        # the fixture itself is not pickled: see '__setstate__'.
+        state = dict(self.__dict__);
+        del state['__entries__'], state['__loose__'];
+        return state;
+
+    def __setstate__(self, state:Dict[str,Any]) -> None:
+        self.__dict__.update(state);
+        path = self.__path__;
+        self.__entries__, self.__loose__ = self.__fixtures__[path] if path in self.__fixtures__ else self.__load__(path);
+        self.__forked__ = dict(self.__served__);
+
+    def Collect(self) -> Any:
+        return {key:count-self.__forked__.get(key, 0) for key,count in self.__served__.items() if count!=self.__forked__.get(key, 0)};
+
+    def Merge(self, state:Any) -> None:
+        for key,count in state.items():
+            self.__served__[key] = self.__served__.get(key, 0)+count;
+
+    def __len__(self):
+        return sum(len(responses) for responses in self.__entries__.values());
+
+    def Get(self, url:str, cookies:Optional[requests.cookies.RequestsCookieJar]=None) -> requests.models.Response:
+        key = self.Key(url);
+        if key not in self.__entries__:
+            candidates = self.__loose__.get(self.Key(url, periods=False), list());
+            if len(candidates)!=1:
+                raise requests.ConnectionError(f"no recorded response for '{key}'");
+            key = candidates[0];
+        responses = self.__entries__[key];
+        served = self.__served__.get(key, 0);
+        self.__served__[key] = served+1;
+        entry = responses[min(served, len(responses)-1)];
+
+        delay = self.__latency__ + (len(entry['content'])/self.__bandwidth__ if self.__bandwidth__ is not None else 0.0);
+        if delay>0:
+            time.sleep(delay);
+
+        response = requests.models.Response();
+        response.url = url;
+        response.status_code = entry['status'];
+        response.reason = entry['reason'];
+        response.encoding = entry['encoding'];
+        response.headers = requests.structures.CaseInsensitiveDict(entry['headers']);
+        response.cookies = requests.cookies.cookiejar_from_dict(entry['cookies']);
+        response._content = entry['content'];
+        return response;